@@ -8,7 +8,42 @@ lightweight and intentionally dependency-free (pure Python).
 Author: generated for user
 """
 
-from typing import Dict, Set, Optional, Iterable, Tuple
+import array
+import sys
+from typing import Dict, List, Set, Optional, Iterable, Tuple
+
+try:
+	import numpy as _np
+except ImportError:  # numpy is optional; batch runs fall back to pure Python
+	_np = None
+
+# Optional Numba JIT for the run() inner loop. The jitted loop is a plain
+# pointer-chase over the dense table and only pays off on long inputs, so
+# run() routes through it only above _JIT_MIN_LEN symbols.
+_JIT_MIN_LEN = 256
+_run_table_jit = None
+if _np is not None:
+	try:
+		from numba import njit as _njit
+
+		@_njit(cache=True)
+		def _run_table_jit(table, A, start, syms):  # pragma: no cover - needs numba
+			cur = start
+			for i in range(syms.shape[0]):
+				cur = table[cur * A + syms[i]]
+				if cur < 0:
+					return -1
+			return cur
+	except ImportError:
+		pass
+
+
+def _intern(name):
+	"""Intern state/symbol strings so hashing is a pointer compare.
+
+	Non-string (but hashable) states pass through unchanged.
+	"""
+	return sys.intern(name) if type(name) is str else name
 
 
 class DFA:
@@ -32,17 +67,18 @@ class DFA:
 				 start: Optional[str] = None,
 				 accept: Optional[Iterable[str]] = None,
 				 make_total: bool = True):
-		self.states: Set[str] = set(states or [])
-		self.alphabet: Set[str] = set(alphabet or [])
+		self.states: Set[str] = {_intern(s) for s in (states or [])}
+		self.alphabet: Set[str] = {_intern(a) for a in (alphabet or [])}
 		self.delta: Dict[str, Dict[str, str]] = {}
-		self.start = start
-		self.accept: Set[str] = set(accept or [])
+		self.start = _intern(start)
+		self.accept: Set[str] = {_intern(s) for s in (accept or [])}
 		self.current: Optional[str] = None
 
-		# Copy transitions defensively
+		# Copy transitions defensively (interning keys/targets as we go)
 		if delta:
 			for s, trans in delta.items():
-				self.delta[s] = dict(trans)
+				s = _intern(s)
+				self.delta[s] = {_intern(a): _intern(t) for a, t in trans.items()}
 				self.states.add(s)
 
 		# add any states that appear as targets
@@ -53,26 +89,90 @@ class DFA:
 		if make_total:
 			self._make_total()
 
+		# dense integer-indexed transition table (built lazily; see _build_table)
+		self._table: Optional[array.array] = None
+		# optional exec()-specialized matcher (see compile())
+		self._compiled = None
+		# optional native machine-code matcher (see compile_native())
+		self._native = None
+		# lazily cached sorted view of accept (sorted states/alphabet live
+		# in _id_state/_id_sym as a side effect of the table build)
+		self._sorted_accept: Optional[List[str]] = None
+		self._build_table()
+		# the arrays are now canonical; drop the construction dict and let
+		# the delta property rematerialize a view on demand (see delta)
+		self._delta_cache = None
+
+		# construction is done: freeze the symbol/accept sets so hot-path
+		# membership checks run against immutable sets with a cached hash
+		self.alphabet = frozenset(self.alphabet)
+		self.accept = frozenset(self.accept)
+
 		# initialize current state
 		self.reset()
 
+	# --- transition view ------------------------------------------------------
+	# Hot-path state lives in parallel arrays (flat transition table, accept
+	# bitmap, state-name list); the dict-of-dicts delta is only a view for
+	# construction, to_dict and the GUI, materialized lazily from the arrays.
+	# Invariant: whenever the table is invalidated, _delta_cache holds the
+	# mutated source dict, so _build_table always has something to read.
+	@property
+	def delta(self) -> Dict[str, Dict[str, str]]:
+		if self._delta_cache is None:
+			self._delta_cache = self._materialize_delta()
+		return self._delta_cache
+
+	@delta.setter
+	def delta(self, value: Dict[str, Dict[str, str]]) -> None:
+		self._delta_cache = value
+
+	def _materialize_delta(self) -> Dict[str, Dict[str, str]]:
+		A = self._A
+		names = self._id_state
+		view: Dict[str, Dict[str, str]] = {}
+		for i, s in enumerate(names):
+			base = i * A
+			view[s] = {a: names[self._table[base + j]]
+					   for j, a in enumerate(self._id_sym)
+					   if self._table[base + j] >= 0}
+		return view
+
 	# --- construction helpers -------------------------------------------------
 	def add_state(self, name: str, is_accept: bool = False) -> None:
+		name = _intern(name)
 		self.states.add(name)
 		if is_accept:
-			self.accept.add(name)
+			self.accept = frozenset(self.accept) | {name}
+			self._sorted_accept = None
+		# materialize the delta view before invalidating the table, so the
+		# rebuild has a source to read (see the invariant on the property);
+		# add_transition gets this ordering for free via delta.setdefault
+		self._delta_cache = self.delta
+		self._table = None
+		self._compiled = None
+		self._native = None
 
 	def add_transition(self, src: str, symbol: str, tgt: str) -> None:
+		src = _intern(src)
+		symbol = _intern(symbol)
+		tgt = _intern(tgt)
 		self.states.add(src)
 		self.states.add(tgt)
-		self.alphabet.add(symbol)
+		self.alphabet = frozenset(self.alphabet) | {symbol}
 		self.delta.setdefault(src, {})[symbol] = tgt
+		self._table = None
+		self._compiled = None
+		self._native = None
 
 	def _make_total(self) -> None:
 		"""Ensure delta is total by adding a dead state and missing transitions.
 
-		Important: iterate over a static snapshot to avoid mutating a set
-		during iteration (which would raise RuntimeError).
+		Runs in a single O(|Q|*|Sigma|) sweep: the dead state is added
+		eagerly (cheap), missing transitions are filled as they are found,
+		and the dead state is dropped again afterwards if nothing actually
+		needed filling. Iterates over a static snapshot to avoid mutating
+		a set during iteration (which would raise RuntimeError).
 		"""
 		# ensure every state has at least an entry in delta
 		for s in list(self.states):
@@ -82,28 +182,99 @@ class DFA:
 		if not self.alphabet:
 			return
 
-		# Add dead state only if some transition is missing
-		need_dead = False
+		dead = DFA.DEAD
+		had_dead = dead in self.states
+		self.states.add(dead)
+		# dead loops to itself on every symbol
+		dead_row = self.delta.setdefault(dead, {})
+		for a in self.alphabet:
+			dead_row.setdefault(a, dead)
+
+		filled = False
 		for s in list(self.states):
+			if s == dead:
+				continue
+			row = self.delta.setdefault(s, {})
 			for a in self.alphabet:
-				if a not in self.delta.get(s, {}):
-					need_dead = True
-					break
-			if need_dead:
-				break
+				if a not in row:
+					row[a] = dead
+					filled = True
 
-		if need_dead:
-			dead = DFA.DEAD
-			self.states.add(dead)
-			# dead loops to itself on every symbol
-			self.delta.setdefault(dead, {})
-			for a in self.alphabet:
-				self.delta[dead].setdefault(a, dead)
+		if not filled and not had_dead:
+			self.states.discard(dead)
+			del self.delta[dead]
+
+	def _build_table(self) -> None:
+		"""Integer-encode states/symbols into a dense flat transition table.
 
-			# fill missing transitions to dead
-			for s in list(self.states):
-				for a in self.alphabet:
-					self.delta.setdefault(s, {}).setdefault(a, dead)
+		The table is an array('i') of size |Q|*|Sigma| indexed by
+		`state_id * A + sym_id`; missing transitions are stored as -1.
+		This removes per-step dict hashing from the hot simulation loops
+		and keeps the whole table in a single contiguous buffer.
+		"""
+		self._id_state: List[str] = sorted(self.states)
+		self._state_id: Dict[str, int] = {s: i for i, s in enumerate(self._id_state)}
+		self._id_sym: List[str] = sorted(self.alphabet)
+		self._sym_id: Dict[str, int] = {a: i for i, a in enumerate(self._id_sym)}
+		S = len(self._id_state)
+		A = self._A = len(self._id_sym)
+		# narrowest signed element type that fits every state id plus the
+		# -1 sentinel; small tables stay entirely within a few cache lines
+		if S <= 0x7f:
+			typecode = 'b'
+		elif S <= 0x7fff:
+			typecode = 'h'
+		else:
+			typecode = 'i'
+		table = array.array(typecode, [-1]) * (S * A)
+		for s, row in self.delta.items():
+			base = self._state_id[s] * A
+			for a, tgt in row.items():
+				sym = self._sym_id.get(a)
+				if sym is not None:  # delta symbols outside the alphabet never match
+					table[base + sym] = self._state_id[tgt]
+		self._table = table
+		self._accept_mask = bytearray(S)
+		for s in self.accept:
+			if s in self._state_id:
+				self._accept_mask[self._state_id[s]] = 1
+		self._start_id = self._state_id.get(self.start, -1)
+		self._compile_unary_paths()
+
+	def _compile_unary_paths(self) -> None:
+		"""Collapse maximal chains of single-exit states for run().
+
+		A state is unary when exactly one symbol leads anywhere useful
+		(everything else goes to the dead state or is missing). For each
+		such state we record the full expected symbol-id sequence and the
+		state reached at its end, so run() can consume a k-symbol chain
+		with one slice comparison instead of k table lookups. Chains of
+		length 1 gain nothing and are not stored.
+		"""
+		self._chains: Dict[int, Tuple[List[int], int]] = {}
+		A = self._A
+		if A == 0:
+			return
+		dead_id = self._state_id.get(DFA.DEAD, -1)
+		unary: Dict[int, Tuple[int, int]] = {}
+		for i in range(len(self._id_state)):
+			exits = [(j, self._table[i * A + j]) for j in range(A)
+					 if self._table[i * A + j] not in (-1, dead_id)]
+			if len(exits) == 1:
+				unary[i] = exits[0]
+		for head, (sym, nxt) in unary.items():
+			expected = [sym]
+			seen = {head}
+			while nxt in unary and nxt not in seen:
+				seen.add(nxt)
+				sym, nxt = unary[nxt]
+				expected.append(sym)
+			if len(expected) > 1:
+				self._chains[head] = (expected, nxt)
+
+	def _ensure_table(self) -> None:
+		if self._table is None:
+			self._build_table()
 
 	# --- simulation -----------------------------------------------------------
 	def reset(self) -> None:
@@ -115,11 +286,15 @@ class DFA:
 		Returns the new current state, or None if symbol not in alphabet
 		or if the DFA is not properly configured.
 		"""
-		if symbol not in self.alphabet:
+		self._ensure_table()
+		sym = self._sym_id.get(symbol, -1)
+		if sym < 0 or self.current is None:
 			return None
-		if self.current is None:
+		cur = self._state_id.get(self.current, -1)
+		if cur < 0:
 			return None
-		self.current = self.delta.get(self.current, {}).get(symbol)
+		nxt = self._table[cur * self._A + sym]
+		self.current = self._id_state[nxt] if nxt >= 0 else None
 		return self.current
 
 	def run(self, w: Iterable[str]) -> Optional[str]:
@@ -128,10 +303,206 @@ class DFA:
 		Returns the final state, or None on invalid input.
 		"""
 		self.reset()
+		self._ensure_table()
+		cur = self._start_id
+		if cur < 0:
+			self.current = None
+			return None
+		if self._native is not None:
+			return self._run_native(w)
+		if (_run_table_jit is not None and hasattr(w, '__len__')
+				and len(w) >= _JIT_MIN_LEN):
+			return self._run_jit(w)
+		# hot loop: one dict probe for the symbol id, one indexed load
+		sid = self._sym_id
+		tbl = self._table
+		A = self._A
+		if self._chains:
+			return self._run_chains(w, cur)
+		for ch in w:
+			sym = sid.get(ch, -1)
+			if sym < 0:
+				return None
+			cur = tbl[cur * A + sym]
+			if cur < 0:
+				self.current = None
+				return None
+		self.current = self._id_state[cur]
+		return self.current
+
+	def _run_chains(self, w: Iterable[str], cur: int) -> Optional[str]:
+		"""run() variant that skips over precompiled unary chains.
+
+		Entering a chain head compares the upcoming symbol ids against the
+		chain's expected sequence in one slice comparison; on mismatch (or
+		a truncated tail) it falls back to the regular per-symbol table walk.
+		"""
+		sid = self._sym_id
+		syms = []
 		for ch in w:
-			if ch not in self.alphabet:
+			s = sid.get(ch, -1)
+			if s < 0:
+				return None
+			syms.append(s)
+		tbl = self._table
+		A = self._A
+		chains = self._chains
+		i = 0
+		n = len(syms)
+		while i < n:
+			chain = chains.get(cur)
+			if chain is not None:
+				expected, nxt = chain
+				k = len(expected)
+				if syms[i:i + k] == expected:
+					i += k
+					cur = nxt
+					continue
+			cur = tbl[cur * A + syms[i]]
+			if cur < 0:
+				self.current = None
 				return None
-			self.step(ch)
+			i += 1
+		self.current = self._id_state[cur]
+		return self.current
+
+	def compile(self) -> None:
+		"""Specialize this DFA into a generated Python matcher.
+
+		Emits one if/elif ladder per state with the transitions baked in as
+		literals and exec()s it, so repeated accepts() calls dispatch on
+		plain comparisons with no table or dict lookups at all. Worth doing
+		for a fixed DFA that will be queried many times; the generated
+		matcher is discarded if the DFA is mutated afterwards.
+		"""
+		self._ensure_table()
+		A = self._A
+		src = ['def _match(w):',
+			   '    cur = %d' % self._start_id,
+			   '    for ch in w:']
+		for i in range(len(self._id_state)):
+			src.append('        %s cur == %d:' % ('if' if i == 0 else 'elif', i))
+			if A == 0:
+				src.append('            return -1')
+				continue
+			for j, sym in enumerate(self._id_sym):
+				src.append('            %s ch == %r:'
+						   % ('if' if j == 0 else 'elif', sym))
+				src.append('                cur = %d' % self._table[i * A + j])
+			src.append('            else:')
+			src.append('                return -1')
+		if self._id_state:
+			src.append('        else:')
+			src.append('            return -1')
+		else:
+			src.append('        return -1')
+		src.append('    return cur')
+		namespace: Dict = {}
+		exec('\n'.join(src), namespace)
+		self._compiled = namespace['_match']
+
+	# x86-64 SysV scan loop: (int32* table, int A, int start, int32* syms, int n)
+	# -> final state id, or -1 when a dead/missing transition is hit.
+	#   mov eax, edx          ; cur = start
+	#   xor r9d, r9d          ; i = 0
+	# loop:
+	#   cmp r9d, r8d          ; i >= n ? done
+	#   jge done
+	#   mov r10d, [rcx+r9*4]  ; sym = syms[i]
+	#   imul eax, esi         ; cur *= A
+	#   add eax, r10d
+	#   mov eax, [rdi+rax*4]  ; cur = table[cur*A + sym]
+	#   test eax, eax
+	#   js done               ; bail out on -1 entries
+	#   inc r9d
+	#   jmp loop
+	# done:
+	#   ret
+	_NATIVE_CODE = bytes([
+		0x89, 0xD0,
+		0x45, 0x31, 0xC9,
+		0x45, 0x39, 0xC1,
+		0x7D, 0x16,
+		0x46, 0x8B, 0x14, 0x89,
+		0x0F, 0xAF, 0xC6,
+		0x44, 0x01, 0xD0,
+		0x8B, 0x04, 0x87,
+		0x85, 0xC0,
+		0x78, 0x05,
+		0x41, 0xFF, 0xC1,
+		0xEB, 0xE5,
+		0xC3,
+	])
+
+	def compile_native(self) -> bool:
+		"""JIT the transition loop into native x86-64 machine code.
+
+		Writes a hand-assembled scan loop (`cur = table[cur*A + sym]`) into
+		an executable mmap page and calls it through ctypes, so long runs
+		cost one machine load per symbol with no interpreter dispatch at
+		all — stdlib only, no JIT dependency. Returns True when the native
+		matcher was installed; returns False (leaving the pure-Python path
+		in place) on other architectures/platforms or when executable
+		mappings are unavailable. Discarded if the DFA is mutated.
+		"""
+		if self._native is not None:
+			return True
+		import platform
+		if not (sys.platform.startswith('linux') and platform.machine() == 'x86_64'):
+			return False
+		self._ensure_table()
+		if self._A == 0 or self._start_id < 0:
+			return False
+		import ctypes
+		import mmap
+		code = DFA._NATIVE_CODE
+		try:
+			buf = mmap.mmap(-1, len(code),
+							prot=mmap.PROT_READ | mmap.PROT_WRITE | mmap.PROT_EXEC)
+		except (OSError, ValueError, PermissionError):
+			return False
+		buf.write(code)
+		addr = ctypes.addressof(ctypes.c_char.from_buffer(buf))
+		ftype = ctypes.CFUNCTYPE(
+			ctypes.c_int32, ctypes.POINTER(ctypes.c_int32), ctypes.c_int32,
+			ctypes.c_int32, ctypes.POINTER(ctypes.c_int32), ctypes.c_int32)
+		# keep the executable page and the marshalled table alive with us
+		self._native_buf = buf
+		# widen elementwise: the narrow table typecode may not be 4 bytes
+		self._native_table = (ctypes.c_int32 * len(self._table))(*self._table)
+		self._native = ftype(addr)
+		return True
+
+	def _run_native(self, w) -> Optional[str]:
+		"""Native-code run loop; only called once compile_native() succeeded."""
+		sid = self._sym_id
+		try:
+			syms = [sid[ch] for ch in w]
+		except KeyError:
+			return None
+		import ctypes
+		arr = (ctypes.c_int32 * len(syms))(*syms)
+		cur = self._native(self._native_table, self._A, self._start_id,
+						   arr, len(syms))
+		if cur < 0:
+			self.current = None
+			return None
+		self.current = self._id_state[cur]
+		return self.current
+
+	def _run_jit(self, w) -> Optional[str]:
+		"""Numba-backed run loop; only called when numba/numpy are present."""
+		sid = self._sym_id
+		syms = _np.fromiter((sid.get(ch, -1) for ch in w),
+							dtype=_np.int32, count=len(w))
+		if (syms < 0).any():
+			return None
+		table = _np.frombuffer(self._table, dtype=self._table.typecode)
+		cur = _run_table_jit(table, self._A, self._start_id, syms)
+		if cur < 0:
+			self.current = None
+			return None
+		self.current = self._id_state[cur]
 		return self.current
 
 	def accepts(self, w: Iterable[str]) -> Optional[bool]:
@@ -139,19 +510,87 @@ class DFA:
 
 		None is returned when the input contains symbols not in alphabet.
 		"""
+		if self._compiled is not None:
+			cur = self._compiled(w)
+			if cur < 0:
+				return None
+			self.current = self._id_state[cur]
+			return bool(self._accept_mask[cur])
 		final = self.run(w)
 		if final is None:
 			return None
-		return final in self.accept
+		return bool(self._accept_mask[self._state_id[final]])
+
+	def run_batch(self, words: Iterable[Iterable[str]]) -> List[Optional[bool]]:
+		"""Classify many inputs at once; returns acceptance per word.
+
+		The result list is parallel to `words`: True/False for accepted/
+		rejected, None where a word contains symbols outside the alphabet
+		(matching `accepts`). With NumPy installed, all words advance one
+		symbol per iteration through C-level gathers on the dense table;
+		without it a pure-Python loop over the same table is used.
+		Does not disturb `self.current`.
+		"""
+		self._ensure_table()
+		sid = self._sym_id
+		encoded = [[sid.get(ch, -1) for ch in w] for w in words]
+		n = len(encoded)
+		if self._start_id < 0:
+			return [None] * n
+		if _np is not None and n:
+			return self._run_batch_np(encoded)
+		tbl = self._table
+		A = self._A
+		results: List[Optional[bool]] = []
+		for syms in encoded:
+			cur = self._start_id
+			for s in syms:
+				if s < 0:
+					cur = -1
+					break
+				cur = tbl[cur * A + s]
+				if cur < 0:
+					break
+			results.append(bool(self._accept_mask[cur]) if cur >= 0 else None)
+		return results
+
+	def _run_batch_np(self, encoded: List[List[int]]) -> List[Optional[bool]]:
+		"""NumPy path for run_batch: step every word one symbol in parallel."""
+		n = len(encoded)
+		lmax = max(len(syms) for syms in encoded)
+		bad = [any(s < 0 for s in syms) for syms in encoded]
+		# -1 both pads exhausted words and masks invalid symbols; invalid
+		# words are already flagged in `bad` so the distinction is moot
+		sym = _np.full((n, max(lmax, 1)), -1, dtype=_np.int16)
+		for i, syms in enumerate(encoded):
+			sym[i, :len(syms)] = syms
+		table = _np.frombuffer(self._table, dtype=self._table.typecode).reshape(
+			len(self._id_state), self._A)
+		cur = _np.full(n, self._start_id, dtype=_np.int32)
+		for t in range(lmax):
+			s = sym[:, t]
+			active = (s >= 0) & (cur >= 0)
+			if not active.any():
+				break
+			cur[active] = table[cur[active], s[active]]
+		mask = self._accept_mask
+		return [None if bad[i] or cur[i] < 0 else bool(mask[cur[i]])
+				for i in range(n)]
 
 	# --- utilities ------------------------------------------------------------
+	def _accept_sorted(self) -> List[str]:
+		if self._sorted_accept is None:
+			self._sorted_accept = sorted(self.accept)
+		return self._sorted_accept
+
 	def to_dict(self) -> Dict:
+		self._ensure_table()
 		return {
-			'states': sorted(self.states),
-			'alphabet': sorted(self.alphabet),
-			'delta': {s: dict(self.delta.get(s, {})) for s in sorted(self.states)},
+			'states': list(self._id_state),
+			'alphabet': list(self._id_sym),
+			'delta': {s: dict(self.delta.get(s, {})) for s in self._id_state},
 			'start': self.start,
-			'accept': sorted(self.accept),
+			'accept': list(self._accept_sorted()),
 		}
 
 	@classmethod
@@ -159,7 +598,8 @@ class DFA:
 		return cls(states=states, alphabet=alphabet, delta=delta, start=start, accept=accept)
 
 	def __repr__(self) -> str:
-		return f"DFA(start={self.start!r}, states={sorted(self.states)!r}, accept={sorted(self.accept)!r})"
+		self._ensure_table()
+		return f"DFA(start={self.start!r}, states={self._id_state!r}, accept={self._accept_sorted()!r})"
 
 
 def example_ends_with_ab() -> DFA:
@@ -183,3 +623,13 @@ if __name__ == '__main__':
 	for t in tests:
 		res = dfa.accepts(t)
 		print(f"{t!r}: {res}")
+
+	# regression: mutating a built DFA must not break the lazily rebuilt
+	# table/delta view (add_state once invalidated the table with no
+	# delta source left to rebuild from)
+	dfa.add_state('q3', is_accept=True)
+	assert dfa.accepts('ab') is True
+	assert 'q3' in dfa.to_dict()['states']
+	dfa.add_transition('q2', 'a', 'q3')
+	assert dfa.accepts('aba') is True
+	print('mutation after construction: ok')
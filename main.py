@@ -7,6 +7,8 @@ Real-world application:
 - Provides visual simulation of security system behavior
 """
 
+import re
+from collections import deque
 import tkinter as tk
 from tkinter import ttk, messagebox
 from typing import Optional
@@ -14,6 +16,32 @@ import sys
 
 from automata_dfa import DFA
 
+# Normalization table for manual input. A single precompiled alternation
+# replaces a chain of str.replace calls so the whole string is scanned once;
+# keys are sorted longest-first so e.g. 'window broken' wins over 'window break'.
+_NORM_MAP = {
+    'arm home': 'arm_home',
+    'arm away': 'arm_away',
+    'motion detected': 'motion',
+    'door opened': 'door',
+    'window broken': 'window',
+    'window break': 'window',
+    'dis arm': 'disarm',
+    'dis_arm': 'disarm',
+    'motion sensor': 'motion',
+    'door sensor': 'door',
+    'delay end': 'delay_end',
+    'delay_end': 'delay_end',
+    'triggered': 'motion',
+    'alarm': 'motion',
+    'siren': 'motion'
+}
+_NORM_RE = re.compile(
+    r'\b(?:' + '|'.join(re.escape(k) for k in sorted(_NORM_MAP, key=len, reverse=True)) + r')\b')
+
+_VALID_COMMANDS = frozenset(
+    {'arm_home', 'arm_away', 'disarm', 'motion', 'door', 'window', 'delay_end'})
+
 
 class SecuritySystemDFAApp(tk.Tk):
     def __init__(self):
@@ -31,7 +59,20 @@ class SecuritySystemDFAApp(tk.Tk):
         }
 
         self.dfa: Optional[DFA] = None
-        self.security_log = []
+        self.security_log = deque(maxlen=20)
+        # memoized (raw input -> normalized/symbols) and per-prefix DFA states,
+        # so update_display does O(1) work per event instead of re-simulating
+        self._norm_cache: Optional[tuple] = None
+        self._prefix_states: Optional[tuple] = None
+        # delta text is static per DFA; rebuild it only when the DFA changes
+        self._last_dfa_id: Optional[int] = None
+        # last values pushed to each status widget, to skip no-op .config()s
+        self._last_ui: dict = {}
+        # transition rows pre-sorted by source state, built once per DFA load
+        self._sorted_rows: Optional[list] = None
+        # last (dfa, pos, input) acceptance computed, to skip repeats
+        self._last_accepts_key: Optional[tuple] = None
+        self._last_accepts_val: Optional[bool] = None
 
         self._create_widgets()
         self.load_security_example()
@@ -130,26 +171,8 @@ class SecuritySystemDFAApp(tk.Tk):
         self.manual_entry.insert(0, current)
 
     def _normalize_input(self, input_str):
-        replacements = {
-            'arm home': 'arm_home',
-            'arm away': 'arm_away',
-            'motion detected': 'motion',
-            'door opened': 'door',
-            'window broken': 'window',
-            'window break': 'window',
-            'dis arm': 'disarm',
-            'dis_arm': 'disarm',
-            'motion sensor': 'motion',
-            'door sensor': 'door',
-            'delay end': 'delay_end',
-            'delay_end': 'delay_end',
-            'triggered': 'motion',
-            'alarm': 'motion',
-            'siren': 'motion'
-        }
-        normalized = input_str.lower().strip()
-        for old, new in replacements.items():
-            normalized = normalized.replace(old, new)
+        normalized = _NORM_RE.sub(lambda m: _NORM_MAP[m.group(0)],
+                                  input_str.lower().strip())
         return ' '.join(normalized.split())
 
     def send_manual_input(self):
@@ -159,13 +182,12 @@ class SecuritySystemDFAApp(tk.Tk):
         if input_str:
             normalized_input = self._normalize_input(input_str)
             commands = normalized_input.split()
-            valid = ['arm_home', 'arm_away', 'disarm', 'motion', 'door', 'window', 'delay_end']
-            invalid = [c for c in commands if c not in valid]
+            invalid = [c for c in commands if c not in _VALID_COMMANDS]
             if invalid:
                 messagebox.showwarning('Invalid Commands',
                     f'Ignored unrecognized commands: {", ".join(invalid)}\n'
-                    f'Valid: {", ".join(valid)}')
-            final_input = ' '.join([c for c in commands if c in valid])
+                    f'Valid: {", ".join(sorted(_VALID_COMMANDS))}')
+            final_input = ' '.join([c for c in commands if c in _VALID_COMMANDS])
             if final_input:
                 self.manual_entry.delete(0, 'end')
                 self.manual_entry.insert(0, final_input)
@@ -209,6 +231,8 @@ class SecuritySystemDFAApp(tk.Tk):
                 delta.setdefault(src, {})[sym] = tgt
 
             self.dfa = DFA(states=states, alphabet=alphabet, delta=delta, start=start, accept=accept)
+            self._prefix_states = None
+            self._index_transitions()
             self.update_display()
             self.log_security_event("Security system DFA loaded")
             messagebox.showinfo('Success', 'Security System DFA loaded successfully!')
@@ -219,14 +243,51 @@ class SecuritySystemDFAApp(tk.Tk):
         import datetime
         timestamp = datetime.datetime.now().strftime("%H:%M:%S")
         log_entry = f"[{timestamp}] {event}\n"
+        # the deque dropping its oldest entry tells us the widget is at
+        # capacity too, so no need to probe the widget's line count
+        was_full = len(self.security_log) == self.security_log.maxlen
         self.security_log.append(log_entry)
-        self.log_text.delete('1.0', 'end')
-        self.log_text.insert('1.0', ''.join(self.security_log[-20:]))
+        # append just the new entry and prune the oldest line once over
+        # capacity, instead of rewriting the whole widget each event
+        self.log_text.insert('end', log_entry)
+        if was_full:
+            self.log_text.delete('1.0', '2.0')
         self.log_text.see('end')
 
     def _input_str(self) -> str:
         return self.manual_entry.get().strip()
 
+    def _parsed_input(self) -> tuple:
+        """Return (normalized, symbols) for the current entry text, memoized."""
+        raw = self._input_str()
+        if self._norm_cache is None or self._norm_cache[0] != raw:
+            normalized = self._normalize_input(raw)
+            self._norm_cache = (raw, normalized, normalized.split())
+        return self._norm_cache[1], self._norm_cache[2]
+
+    def _prefix_accepts(self, symbols, pos) -> Optional[bool]:
+        """Acceptance of symbols[:pos], using incrementally cached prefix states.
+
+        Equivalent to self.dfa.accepts(symbols[:pos]) but each prefix is
+        extended one transition at a time instead of re-simulated from the
+        start on every display update.
+        """
+        dfa = self.dfa
+        dfa._ensure_table()
+        pos = min(pos, len(symbols))
+        key = tuple(symbols)
+        if self._prefix_states is None or self._prefix_states[0] != key:
+            self._prefix_states = (key, [dfa._start_id])
+        states = self._prefix_states[1]
+        while len(states) <= pos:
+            cur = states[-1]
+            sym = dfa._sym_id.get(symbols[len(states) - 1], -1)
+            states.append(dfa._table[cur * dfa._A + sym] if cur >= 0 and sym >= 0 else -1)
+        state = states[pos]
+        if state < 0:
+            return None
+        return bool(dfa._accept_mask[state])
+
     def reset_sim(self):
         if not self._check_dfa():
             return
@@ -238,8 +299,7 @@ class SecuritySystemDFAApp(tk.Tk):
     def step_sim(self):
         if not self._check_dfa():
             return
-        w = self._normalize_input(self._input_str())
-        symbols = w.split()
+        w, symbols = self._parsed_input()
         pos = int(self.position_label['text'])
         if pos >= len(symbols):
             messagebox.showinfo('End', 'Security sequence complete')
@@ -261,16 +321,10 @@ class SecuritySystemDFAApp(tk.Tk):
     def run_sim(self):
         if not self._check_dfa():
             return
-        w = self._normalize_input(self._input_str())
-        if not w.strip():
+        w, symbols = self._parsed_input()
+        if not w:
             messagebox.showwarning('No Input', 'Please enter security commands to process.')
             return
-        symbols = w.split()
-        valid = ['arm_home', 'arm_away', 'disarm', 'motion', 'door', 'window', 'delay_end']
-        for sym in symbols:
-            if sym not in valid:
-                messagebox.showerror('Error', f'Unrecognized command: "{sym}"')
-                return
         print("DEBUG: running DFA.accepts on:", symbols)
         res = self.dfa.accepts(symbols)
         if res is None:
@@ -282,33 +336,68 @@ class SecuritySystemDFAApp(tk.Tk):
         messagebox.showinfo('Security Status', f'Security System Status: {status_msg}')
         self.log_security_event(f"Sequence completed - System secure: {res}")
 
+    def _config_if_changed(self, key, widget, **opts):
+        """Reconfigure a widget only when its options actually changed."""
+        if self._last_ui.get(key) != opts:
+            widget.config(**opts)
+            self._last_ui[key] = opts
+
+    def _index_transitions(self):
+        """Precompute (state, [(command, target), ...]) rows for the delta view.
+
+        Sorting and row lookup happen once per DFA load instead of every
+        display update.
+        """
+        self.dfa._ensure_table()
+        self._sorted_rows = []
+        for s in self.dfa._id_state:
+            row = self.dfa.delta.get(s, {})
+            pairs = [(a, row[a]) for a in self.dfa._id_sym if row.get(a)]
+            self._sorted_rows.append((s, pairs))
+
+    def _set_indicator(self, color):
+        if self._last_ui.get('indicator') != color:
+            self.state_canvas.itemconfig(self.state_indicator, fill=color)
+            self._last_ui['indicator'] = color
+
     def update_display(self):
         if self.dfa is None:
-            self.current_label.config(text='-')
-            self.accept_label.config(text='-')
-            self.status_label.config(text='SYSTEM OFFLINE', foreground='gray')
-            self.state_canvas.itemconfig(self.state_indicator, fill='gray')
+            self._config_if_changed('current', self.current_label, text='-')
+            self._config_if_changed('accept', self.accept_label, text='-')
+            self._config_if_changed('status', self.status_label,
+                                    text='SYSTEM OFFLINE', foreground='gray')
+            self._set_indicator('gray')
             return
         current_state = self.dfa.current or 'Disarmed'
-        self.current_label.config(text=current_state)
+        self._config_if_changed('current', self.current_label, text=current_state)
         color = self.state_colors.get(current_state, 'blue')
-        self.status_label.config(text=current_state.upper().replace('_', ' '), foreground=color)
-        self.state_canvas.itemconfig(self.state_indicator, fill=color)
+        self._config_if_changed('status', self.status_label,
+                                text=current_state.upper().replace('_', ' '),
+                                foreground=color)
+        self._set_indicator(color)
 
-        w = self._normalize_input(self._input_str())
+        w, symbols = self._parsed_input()
         pos = int(self.position_label['text'])
-        symbols = w.split()[:pos] if w else []
-        accepted = self.dfa.accepts(symbols)
-        self.accept_label.config(text='ERROR' if accepted is None else ('YES' if accepted else 'NO'))
-
-        lines = ["State       --Command    --> Next State", "-" * 40]
-        for s in sorted(self.dfa.delta.keys()):
-            for a in sorted(self.dfa.alphabet):
-                t = self.dfa.delta.get(s, {}).get(a, '')
-                if t:
+        key = (id(self.dfa), pos, w)
+        if key == self._last_accepts_key:
+            accepted = self._last_accepts_val
+        else:
+            accepted = self._prefix_accepts(symbols, pos)
+            self._last_accepts_key = key
+            self._last_accepts_val = accepted
+        self._config_if_changed('accept', self.accept_label,
+                                text='ERROR' if accepted is None else ('YES' if accepted else 'NO'))
+
+        if self._last_dfa_id != id(self.dfa):
+            if self._sorted_rows is None:
+                self._index_transitions()
+            lines = ["State       --Command    --> Next State", "-" * 40]
+            for s, pairs in self._sorted_rows:
+                for a, t in pairs:
                     lines.append(f"{s:12} --{a:10}--> {t:12}")
-        self.delta_text.delete('1.0', 'end')
-        self.delta_text.insert('1.0', '\n'.join(lines))
+            self.delta_text.delete('1.0', 'end')
+            self.delta_text.insert('1.0', '\n'.join(lines))
+            self._last_dfa_id = id(self.dfa)
 
     def _check_dfa(self) -> bool:
         if self.dfa is None: